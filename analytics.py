@@ -0,0 +1,371 @@
+# analytics.py
+import functools
+import importlib
+import importlib.util
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import psycopg2
+
+from db import get_connection
+from stats_snapshot import (
+    begin_repeatable_read,
+    has_change_tracking,
+    register_consumer,
+)
+
+logger = logging.getLogger(__name__)
+
+# Set TRADING_JOURNAL_ANALYTICS=duckdb to route aggregate queries to the
+# local columnar mirror instead of tracker.trades.
+BACKEND = os.environ.get("TRADING_JOURNAL_ANALYTICS", "postgres")
+MIRROR_PATH = Path(__file__).resolve().parent / "analytics_data" / "trades.duckdb"
+MIRROR_FORMAT = 2
+
+# Aggregate queries sync at most this often, so page renders stay read-only
+# against Postgres; the consumer position (and tombstone pruning) is written
+# back far less often, which only delays pruning.
+SYNC_INTERVAL = 10          # seconds
+REGISTER_INTERVAL = 3600    # seconds
+
+MIRROR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id BIGINT PRIMARY KEY,
+    trade_date TIMESTAMP,
+    symbol VARCHAR,
+    direction VARCHAR,
+    setup VARCHAR,
+    outcome VARCHAR,
+    entry_price DOUBLE,
+    exit_price DOUBLE
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    format INTEGER,
+    txid_snapshot VARCHAR
+);
+"""
+
+TRADE_COLUMNS = [
+    "id", "trade_date", "symbol", "direction", "setup",
+    "outcome", "entry_price", "exit_price",
+]
+
+TRADE_SELECT = """
+    SELECT
+        id,
+        trade_date::timestamp,
+        symbol,
+        direction::text,
+        setup::text,
+        outcome::text,
+        entry_price::float8,
+        exit_price::float8
+    FROM tracker.trades
+"""
+
+_lock = threading.Lock()
+_last_sync = None
+_last_register = None
+_warned = False
+
+
+class MirrorUnavailable(Exception):
+    pass
+
+
+# -----------------------------
+# Mirror
+# -----------------------------
+def enabled():
+    return BACKEND == "duckdb" and importlib.util.find_spec("duckdb") is not None
+
+
+def _duckdb():
+    return importlib.import_module("duckdb")
+
+
+def _open(read_only=False):
+    """Open the mirror file; callers close it again right away.
+
+    DuckDB lets only one process at a time hold the file for writing, so the
+    connection is kept only for a single sync or query.
+    """
+    if read_only:
+        return _duckdb().connect(str(MIRROR_PATH), read_only=True)
+
+    MIRROR_PATH.parent.mkdir(parents=True, exist_ok=True)
+    con = _duckdb().connect(str(MIRROR_PATH))
+    con.execute(MIRROR_SCHEMA)
+    state = con.execute("SELECT format FROM sync_state").fetchone()
+    if state is None or state[0] != MIRROR_FORMAT:
+        # Unknown or older layout: start over with a full load
+        con.execute("DELETE FROM trades")
+        con.execute("DELETE FROM sync_state")
+        con.execute("INSERT INTO sync_state VALUES (?, NULL)", [MIRROR_FORMAT])
+    return con
+
+
+def _fetch_changes(conn, previous):
+    """Read changes not visible in the `previous` txid_snapshot (all rows if None).
+
+    Returns (current txid_snapshot, trade ids to drop, rows to insert).
+    """
+    cur = conn.cursor()
+
+    try:
+        begin_repeatable_read(cur)
+        if not has_change_tracking(cur):
+            raise MirrorUnavailable(
+                "change tracking is not installed (run 'tracking_journal.py migrate')"
+            )
+
+        cur.execute("SELECT txid_current_snapshot()::text;")
+        current = cur.fetchone()[0]
+
+        if previous is None:
+            cur.execute(TRADE_SELECT + ";")
+            changed = cur.fetchall()
+            removed = []
+        else:
+            cur.execute("""
+                SELECT DISTINCT trade_id
+                FROM tracker.trade_tombstones
+                WHERE xid >= txid_snapshot_xmin(%(prev)s::txid_snapshot)
+                  AND NOT txid_visible_in_snapshot(xid, %(prev)s::txid_snapshot);
+            """, {"prev": previous})
+            removed = [r[0] for r in cur.fetchall()]
+
+            cur.execute(TRADE_SELECT + """
+                WHERE change_xid >= txid_snapshot_xmin(%(prev)s::txid_snapshot)
+                  AND NOT txid_visible_in_snapshot(change_xid, %(prev)s::txid_snapshot);
+            """, {"prev": previous})
+            changed = cur.fetchall()
+
+        conn.commit()
+    finally:
+        cur.close()
+
+    return current, removed, changed
+
+
+def _apply_changes(con, full, removed, changed, current):
+    con.execute("BEGIN TRANSACTION")
+    try:
+        if full:
+            con.execute("DELETE FROM trades")
+        else:
+            ids = sorted(set(removed) | {row[0] for row in changed})
+            if ids:
+                con.execute("DELETE FROM trades WHERE list_contains(?, id)", [ids])
+        if changed:
+            import pandas as pd
+
+            incoming = pd.DataFrame(changed, columns=TRADE_COLUMNS)
+            con.register("incoming", incoming)
+            con.execute("INSERT INTO trades SELECT * FROM incoming")
+            con.unregister("incoming")
+        con.execute("UPDATE sync_state SET txid_snapshot = ?", [current])
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+
+def sync(full=False, conn=None):
+    """Bring the mirror up to date with every transaction committed since the last sync.
+
+    Updated rows appear both as a tombstone and as a changed row of the same
+    transaction, so they are dropped and re-inserted together. Reads through
+    `conn` if given (left open), else a connection of its own. Returns the
+    number of trades in the mirror.
+    """
+    global _last_sync, _last_register
+
+    con = _open()
+    own = conn is None
+    if own:
+        conn = get_connection()
+    try:
+        previous = None
+        if not full:
+            previous = con.execute("SELECT txid_snapshot FROM sync_state").fetchone()[0]
+
+        current, removed, changed = _fetch_changes(conn, previous)
+        _apply_changes(con, previous is None, removed, changed, current)
+        _last_sync = time.monotonic()
+
+        # An older recorded position only keeps tombstones around for longer
+        if _last_register is None or _last_sync - _last_register >= REGISTER_INTERVAL:
+            register_consumer(conn, f"analytics:{MIRROR_PATH}", current)
+            _last_register = _last_sync
+
+        return con.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+    finally:
+        if own:
+            conn.close()
+        con.close()
+
+
+def rebuild(conn=None):
+    """Drop the mirror's contents and reload every row from Postgres."""
+    with _lock:
+        try:
+            return sync(full=True, conn=conn)
+        except (_duckdb().Error, psycopg2.Error) as e:
+            raise MirrorUnavailable(str(e)) from e
+
+
+def _query(sql, params, conn=None):
+    with _lock:
+        try:
+            if _last_sync is None or time.monotonic() - _last_sync >= SYNC_INTERVAL:
+                sync(conn=conn)
+            con = _open(read_only=True)
+            try:
+                cur = con.execute(sql, params)
+                columns = [d[0] for d in cur.description]
+                return [dict(zip(columns, row)) for row in cur.fetchall()]
+            finally:
+                con.close()
+        except (_duckdb().Error, psycopg2.Error) as e:
+            raise MirrorUnavailable(str(e)) from e
+
+
+def warn_unavailable(e):
+    global _warned
+    if not _warned:
+        logger.warning("Analytics mirror unavailable, using Postgres: %s", e)
+        _warned = True
+
+
+def mirrored(func):
+    """Serve `func` from the mirror query of the same name when it is enabled.
+
+    Falls back to the wrapped Postgres query if the mirror cannot be used,
+    e.g. when another process is syncing the DuckDB file at that moment.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if enabled():
+            try:
+                return MIRROR_QUERIES[func.__name__](*args, **kwargs)
+            except MirrorUnavailable as e:
+                warn_unavailable(e)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+# -----------------------------
+# Aggregate queries
+# -----------------------------
+def get_stats_by_setup(start_date, end_date):
+    return _query(
+        """
+        SELECT
+            setup,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM trades
+        WHERE trade_date::date BETWEEN ? AND ?
+          AND outcome IS NOT NULL
+        GROUP BY setup
+        ORDER BY setup
+        """,
+        [start_date, end_date]
+    )
+
+
+def get_stats_by_direction(start_date, end_date):
+    return _query(
+        """
+        SELECT
+            direction,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM trades
+        WHERE trade_date::date BETWEEN ? AND ?
+          AND outcome IS NOT NULL
+        GROUP BY direction
+        ORDER BY direction
+        """,
+        [start_date, end_date]
+    )
+
+
+def get_stats_for_setups(start_date, end_date, setups):
+    rows = _query(
+        """
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM trades
+        WHERE trade_date::date BETWEEN ? AND ?
+          AND outcome IS NOT NULL
+          AND list_contains(?, setup)
+        """,
+        [start_date, end_date, list(setups)]
+    )
+    return rows[0]
+
+
+def get_direction_stats_for_setups(start_date, end_date, setups):
+    return _query(
+        """
+        SELECT
+            direction,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM trades
+        WHERE trade_date::date BETWEEN ? AND ?
+          AND outcome IS NOT NULL
+          AND list_contains(?, setup)
+        GROUP BY direction
+        ORDER BY direction
+        """,
+        [start_date, end_date, list(setups)]
+    )
+
+
+def get_win_counts(conn=None):
+    """All-time [trades, wins] by setup and by direction, shaped like a stats snapshot."""
+    rows = _query(
+        """
+        SELECT
+            setup,
+            direction,
+            COUNT(*) AS trades,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins
+        FROM trades
+        WHERE outcome IS NOT NULL
+        GROUP BY setup, direction
+        """,
+        [],
+        conn
+    )
+
+    counts = {"setup": {}, "direction": {}}
+    for r in rows:
+        for kind in ("setup", "direction"):
+            totals = counts[kind].setdefault(r[kind], [0, 0])
+            totals[0] += r["trades"]
+            totals[1] += r["wins"]
+    return counts
+
+
+MIRROR_QUERIES = {
+    f.__name__: f
+    for f in (
+        get_stats_by_setup,
+        get_stats_by_direction,
+        get_stats_for_setups,
+        get_direction_stats_for_setups,
+    )
+}
@@ -0,0 +1,322 @@
+# api.py
+import argparse
+import base64
+import hashlib
+import json
+import select
+import threading
+import time
+import traceback
+from datetime import date, datetime
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from db import get_connection
+from queries import (
+    get_day_outcomes_for_month,
+    get_stats_by_direction,
+    get_stats_by_setup,
+    get_trades_page,
+)
+
+PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 500
+
+# Every write to tracker.trades bumps the version of the month(s) it touches
+# and announces the new version on the trade_months channel.
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS tracker.month_versions (
+    month date PRIMARY KEY,
+    version bigint NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION tracker.bump_month_version() RETURNS trigger AS $$
+DECLARE
+    m date;
+    v bigint;
+BEGIN
+    FOR m IN
+        SELECT DISTINCT date_trunc('month', d)::date
+        FROM (VALUES
+            (CASE WHEN TG_OP <> 'INSERT' THEN OLD.trade_date END),
+            (CASE WHEN TG_OP <> 'DELETE' THEN NEW.trade_date END)
+        ) AS changed(d)
+        WHERE d IS NOT NULL
+    LOOP
+        INSERT INTO tracker.month_versions (month, version)
+        VALUES (m, 1)
+        ON CONFLICT (month) DO UPDATE
+            SET version = tracker.month_versions.version + 1
+        RETURNING version INTO v;
+        PERFORM pg_notify('trade_months', m::text || ' ' || v::text);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trades_month_version ON tracker.trades;
+CREATE TRIGGER trades_month_version
+AFTER INSERT OR UPDATE OR DELETE ON tracker.trades
+FOR EACH ROW EXECUTE FUNCTION tracker.bump_month_version();
+"""
+
+
+# -----------------------------
+# Month versions
+# -----------------------------
+class MonthVersions:
+    """In-memory copy of tracker.month_versions, kept fresh by LISTEN/NOTIFY.
+
+    While the listener is disconnected `ready` is False and no ETags are
+    issued, so a missed notification can never produce a stale 304.
+    """
+
+    def __init__(self):
+        self.versions = {}
+        self.ready = False
+        self.lock = threading.Lock()
+
+    def listen_forever(self):
+        while True:
+            try:
+                self._listen()
+            except Exception as e:
+                print(f"Month version listener failed: {e}")
+            with self.lock:
+                self.ready = False
+            time.sleep(5)
+
+    def _listen(self):
+        conn = get_connection()
+        conn.autocommit = True
+        cur = conn.cursor()
+
+        try:
+            # LISTEN before loading so no bump is lost in between
+            cur.execute("LISTEN trade_months;")
+            cur.execute("SELECT month, version FROM tracker.month_versions;")
+            with self.lock:
+                self.versions = {m: v for m, v in cur.fetchall()}
+                self.ready = True
+
+            while True:
+                if select.select([conn], [], [], 60) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    month, version = conn.notifies.pop(0).payload.split()
+                    month = date.fromisoformat(month)
+                    with self.lock:
+                        self.versions[month] = max(
+                            self.versions.get(month, 0), int(version)
+                        )
+        finally:
+            cur.close()
+            conn.close()
+
+
+month_versions = MonthVersions()
+
+
+def ensure_schema():
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(SCHEMA_SQL)
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def months_between(start_date, end_date):
+    months = []
+    year, month = start_date.year, start_date.month
+    while (year, month) <= (end_date.year, end_date.month):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def make_etag(resource, months):
+    with month_versions.lock:
+        if not month_versions.ready:
+            return None
+        versions = [month_versions.versions.get(m, 0) for m in months]
+
+    key = resource + "|" + ",".join(f"{m}:{v}" for m, v in zip(months, versions))
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(etag, if_none_match):
+    """Weak comparison of `etag` against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# -----------------------------
+# Encoding
+# -----------------------------
+def to_json(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_cursor(row):
+    raw = f"{row['trade_date'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        trade_date, trade_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(trade_date), int(trade_id)
+    except ValueError:
+        raise ValueError("Invalid cursor") from None
+
+
+# -----------------------------
+# Resources
+# -----------------------------
+def parse_date(params, name):
+    if name not in params:
+        raise ValueError(f"Missing '{name}' parameter")
+    return date.fromisoformat(params[name])
+
+
+def date_range(params):
+    if "day" in params:
+        day = parse_date(params, "day")
+        return day, day
+    start_date = parse_date(params, "start")
+    end_date = parse_date(params, "end")
+    if end_date < start_date:
+        raise ValueError("'end' must not be before 'start'")
+    return start_date, end_date
+
+
+def trades_resource(params):
+    start_date, end_date = date_range(params)
+
+    limit = int(params.get("limit", PAGE_LIMIT))
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"'limit' must be between 1 and {MAX_PAGE_LIMIT}")
+
+    after = decode_cursor(params["cursor"]) if "cursor" in params else None
+
+    def load():
+        rows = get_trades_page(start_date, end_date, after, limit)
+        return {
+            "trades": rows,
+            "next_cursor": encode_cursor(rows[-1]) if len(rows) == limit else None,
+        }
+
+    return months_between(start_date, end_date), load
+
+
+def month_outcomes_resource(params):
+    year, month = int(params.get("year", 0)), int(params.get("month", 0))
+    if not 1 <= month <= 12 or year < 1:
+        raise ValueError("'year' and 'month' are required")
+
+    def load():
+        outcomes = get_day_outcomes_for_month(year, month)
+        return {day.isoformat(): color for day, color in sorted(outcomes.items())}
+
+    return [date(year, month, 1)], load
+
+
+def stats_resource(query):
+    def resource(params):
+        start_date, end_date = date_range(params)
+        return months_between(start_date, end_date), lambda: query(start_date, end_date)
+    return resource
+
+
+ROUTES = {
+    "/trades": trades_resource,
+    "/months/outcomes": month_outcomes_resource,
+    "/stats/setup": stats_resource(get_stats_by_setup),
+    "/stats/direction": stats_resource(get_stats_by_direction),
+}
+
+
+# -----------------------------
+# HTTP
+# -----------------------------
+class Handler(BaseHTTPRequestHandler):
+    server_version = "TradingJournalAPI/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path not in ROUTES:
+            return self.send_json(404, {"error": "Not found"})
+
+        try:
+            months, load = ROUTES[url.path](params)
+        except ValueError as e:
+            return self.send_json(400, {"error": str(e)})
+
+        etag = make_etag(self.path, months)
+        if etag and etag_matches(etag, self.headers.get("If-None-Match")):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        try:
+            payload = load()
+        except Exception:
+            traceback.print_exc()
+            return self.send_json(500, {"error": "Internal server error"})
+
+        self.send_json(200, payload, etag)
+
+    def send_json(self, status, payload, etag=None):
+        body = json.dumps(payload, default=to_json).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trading Journal read-only API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--install-schema", action="store_true",
+                        help="create the month version table and trigger, then exit")
+    args = parser.parse_args()
+
+    if args.install_schema:
+        ensure_schema()
+        print("✅ Month version tracking installed")
+        return
+
+    threading.Thread(target=month_versions.listen_forever, daemon=True).start()
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"Serving on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
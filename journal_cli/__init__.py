@@ -0,0 +1,22 @@
+# journal_cli/__init__.py
+# Only the stdlib is imported here: each command module pulls in its own
+# dependencies (psycopg2, numpy, ...) when it is run.
+import argparse
+import importlib
+
+COMMANDS = ["add", "close", "stats", "simulate", "prices", "migrate", "mirror"]
+
+
+def build_parser(commands=COMMANDS):
+    parser = argparse.ArgumentParser(description="PnF Trading Journal")
+    parser.add_argument("cmd", choices=commands)
+    parser.add_argument("--full", action="store_true",
+                        help="stats: ignore the local snapshot and recompute; "
+                             "mirror: rebuild without checking first")
+    parser.add_argument("--verify", action="store_true",
+                        help="stats: check the incremental snapshot against a full recompute")
+    return parser
+
+
+def run_command(session, args):
+    importlib.import_module(f"journal_cli.{args.cmd}").run(session, args)
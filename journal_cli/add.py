@@ -0,0 +1,46 @@
+# journal_cli/add.py
+from pathlib import Path
+
+
+def run(session, args):
+    symbol = input("Symbol (e.g. EURUSD): ").upper().strip()
+
+    direction = input("Direction (LONG / SHORT): ").upper().strip()
+    if direction not in ("LONG", "SHORT"):
+        raise ValueError("Direction must be LONG or SHORT")
+
+    setup = input("Setup type (A / B / C): ").upper().strip()
+    if setup not in ("A", "B", "C"):
+        raise ValueError("Setup must be A, B, or C")
+
+    notes = input("Notes (optional): ").strip()
+
+    screenshot = input("Screenshot path (optional): ").strip()
+    screenshot_path = None
+    if screenshot:
+        p = Path(screenshot)
+        if not p.exists():
+            raise FileNotFoundError("Screenshot file does not exist")
+        screenshot_path = str(p.resolve())
+
+    conn = session.conn
+    cur = conn.cursor()
+
+    cur.execute("""
+        INSERT INTO tracker.trades
+        (symbol, direction, setup, notes, screenshot_path)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING id;
+    """, (
+        symbol,
+        direction,
+        setup,
+        notes if notes else None,
+        screenshot_path
+    ))
+
+    trade_id = cur.fetchone()[0]
+    conn.commit()
+    cur.close()
+
+    print(f"\n✅ Trade recorded with ID: {trade_id}")
@@ -0,0 +1,34 @@
+# journal_cli/close.py
+
+
+def run(session, args):
+    trade_id = input("Trade ID to close: ").strip()
+    if not trade_id.isdigit():
+        raise ValueError("Trade ID must be a number")
+
+    outcome = input("Outcome (WIN / LOSS / BREAKEVEN): ").upper().strip()
+    if outcome not in ("WIN", "LOSS", "BREAKEVEN"):
+        raise ValueError("Invalid outcome")
+
+    exit_price = input("Exit price (optional): ").strip()
+    exit_price_val = float(exit_price) if exit_price else None
+
+    conn = session.conn
+    cur = conn.cursor()
+
+    cur.execute("""
+        UPDATE tracker.trades
+        SET outcome = %s,
+            exit_price = %s
+        WHERE id = %s;
+    """, (outcome, exit_price_val, trade_id))
+
+    if cur.rowcount == 0:
+        conn.rollback()
+        cur.close()
+        raise ValueError("Trade ID not found")
+
+    conn.commit()
+    cur.close()
+
+    print(f"\n✅ Trade {trade_id} closed as {outcome}")
@@ -0,0 +1,7 @@
+# journal_cli/migrate.py
+from stats_snapshot import install_schema
+
+
+def run(session, args):
+    install_schema(session.conn)
+    print("\n✅ Change tracking installed on tracker.trades")
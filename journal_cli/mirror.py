@@ -0,0 +1,21 @@
+# journal_cli/mirror.py
+import analytics
+from db import DB_NAME
+from stats_snapshot import full_recompute
+
+
+def run(session, args):
+    if not analytics.enabled():
+        raise ValueError("Analytics mirror is disabled (set TRADING_JOURNAL_ANALYTICS=duckdb "
+                         "and install duckdb)")
+
+    if not args.full:
+        mirror = analytics.get_win_counts(session.conn)
+        fresh = full_recompute(session.conn, DB_NAME)
+        if mirror["setup"] == fresh["setup"] and mirror["direction"] == fresh["direction"]:
+            print("\n✅ Analytics mirror matches Postgres")
+            return
+        print("\n⚠️ Analytics mirror had drifted from Postgres; rebuilding")
+
+    count = analytics.rebuild(session.conn)
+    print(f"\n✅ Analytics mirror rebuilt with {count} trades")
@@ -0,0 +1,15 @@
+# journal_cli/prices.py
+from pathlib import Path
+
+from price_store import ingest_bars
+
+
+def run(session, args):
+    symbol = input("Symbol (e.g. EURUSD): ").upper().strip()
+
+    path = Path(input("OHLC CSV path: ").strip())
+    if not path.exists():
+        raise FileNotFoundError("Price file does not exist")
+
+    count = ingest_bars(symbol, path)
+    print(f"\n✅ Ingested {count} bars for {symbol}")
@@ -0,0 +1,29 @@
+# journal_cli/session.py
+from db import get_connection
+
+
+class Session:
+    """Opens the database connection on first use and keeps it for later commands."""
+
+    def __init__(self):
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None or self._conn.closed:
+            self._conn = get_connection()
+        return self._conn
+
+    def reset(self):
+        """Roll back after a failed command, dropping the connection if it is broken."""
+        if self._conn is None or self._conn.closed:
+            return
+        try:
+            self._conn.rollback()
+        except Exception:
+            self._conn.close()
+
+    def close(self):
+        if self._conn is not None and not self._conn.closed:
+            self._conn.close()
+        self._conn = None
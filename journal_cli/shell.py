@@ -0,0 +1,37 @@
+# journal_cli/shell.py
+import shlex
+
+from journal_cli import COMMANDS, build_parser, run_command
+
+
+def run(session, args):
+    parser = build_parser(COMMANDS)
+    parser.prog = "journal"
+
+    print("Commands: " + ", ".join(COMMANDS) + ", quit")
+
+    while True:
+        try:
+            line = input("\njournal> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+
+        if not line:
+            continue
+        if line in ("quit", "exit"):
+            break
+
+        try:
+            cmd_args = parser.parse_args(shlex.split(line))
+        except SystemExit:
+            continue
+
+        try:
+            run_command(session, cmd_args)
+        except KeyboardInterrupt:
+            print()
+            session.reset()
+        except Exception as e:
+            session.reset()
+            print(f"\n❌ {e}")
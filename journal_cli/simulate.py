@@ -0,0 +1,28 @@
+# journal_cli/simulate.py
+from simulation import simulate_setup
+
+
+def run(session, args):
+    setup = input("Setup type (A / B / C): ").upper().strip()
+    if setup not in ("A", "B", "C"):
+        raise ValueError("Setup must be A, B, or C")
+
+    start_date = input("Start date (YYYY-MM-DD): ").strip()
+    end_date = input("End date (YYYY-MM-DD): ").strip()
+
+    risk = input("Risk per trade % (default 1): ").strip()
+    risk_val = float(risk) / 100 if risk else 0.01
+
+    sim = simulate_setup(session.conn, setup, start_date, end_date,
+                         n_paths=100_000, risk=risk_val)
+    if sim is None:
+        print("\nNo closed trades for this setup and range.")
+        return
+
+    print(f"\n=== Setup {setup}: {sim['paths']} paths x {sim['trades']} trades "
+          f"(from {sim['sample_size']} trades) ===")
+    print(f"Max drawdown p50 / p95 / p99: "
+          f"{sim['drawdown_p50']:.1%} / {sim['drawdown_p95']:.1%} / {sim['drawdown_p99']:.1%}")
+    print(f"Risk of ruin: {sim['risk_of_ruin']:.2%}")
+    print(f"Longest losing streak: avg {sim['avg_loss_streak']:.1f}, p95 {sim['loss_streak_p95']:.0f}")
+    print(f"Longest winning streak: avg {sim['avg_win_streak']:.1f}")
@@ -0,0 +1,45 @@
+# journal_cli/stats.py
+import os
+
+from db import DB_NAME
+from stats_snapshot import get_stats, stat_rows
+
+
+def run(session, args):
+    # The mirror is only synced when change tracking is installed
+    snapshot, tracked, verified = None, True, None
+    full, verify = args.full, args.verify
+
+    # Only pull in the mirror (and duckdb) when it is configured
+    if os.environ.get("TRADING_JOURNAL_ANALYTICS") == "duckdb" and not (full or verify):
+        import analytics
+
+        if analytics.enabled():
+            try:
+                snapshot = analytics.get_win_counts(session.conn)
+            except analytics.MirrorUnavailable as e:
+                # A failed sync may leave the shared connection mid-transaction
+                session.reset()
+                print(f"Analytics mirror unavailable, using Postgres: {e}")
+
+    if snapshot is None:
+        snapshot, tracked, verified = get_stats(
+            session.conn, DB_NAME, full=full, verify=verify
+        )
+
+    print("\n=== Win Rate by Setup ===")
+    for row in stat_rows(snapshot, "setup"):
+        print(row)
+
+    print("\n=== Win Rate by Direction ===")
+    for row in stat_rows(snapshot, "direction"):
+        print(row)
+
+    if not tracked:
+        print("\nℹ️ Change tracking is not installed, so stats were fully recomputed; "
+              "run 'tracking_journal.py migrate' once to enable incremental stats")
+
+    if verified is False:
+        print("\n⚠️ Incremental snapshot had drifted; replaced with a full recompute")
+    elif verified:
+        print("\n✅ Incremental snapshot matches a full recompute")
@@ -0,0 +1,262 @@
+# price_store.py
+import csv
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from psycopg2.extras import RealDictCursor
+
+from db import get_connection
+
+PRICE_DIR = Path(__file__).resolve().parent / "price_data"
+
+# Row order of the bars array, shape (4, n)
+OPEN, HIGH, LOW, CLOSE = range(4)
+
+EXIT_SCAN_CHUNK = 2_048     # bars checked per step when looking for a closed trade's exit
+MAX_EXIT_BARS = 100_000     # give up (no excursion data) if the exit is not found this far in
+
+_open_stores = {}
+
+
+# -----------------------------
+# Storage
+# -----------------------------
+def _symbol_dir(symbol):
+    return PRICE_DIR / symbol.upper().strip()
+
+
+def _epoch(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    if hasattr(value, "year"):
+        return _epoch(datetime(value.year, value.month, value.day))
+    value = str(value).strip()
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return int(np.datetime64(value, "s").astype(np.int64))
+
+
+def _save(path, array):
+    tmp = path.with_name(path.stem + ".tmp.npy")
+    np.save(tmp, array)
+    os.replace(tmp, path)
+
+
+def ingest_bars(symbol, csv_path):
+    """Merge a `timestamp,open,high,low,close` CSV into the symbol's bar store.
+
+    Timestamps may be epoch seconds or ISO 8601 (UTC). Rows with a timestamp
+    already in the store replace the stored bar.
+    """
+    timestamps = []
+    bars = []
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            row = {k.strip().lower(): v for k, v in row.items()}
+            timestamps.append(_epoch(row["timestamp"]))
+            bars.append((
+                float(row["open"]),
+                float(row["high"]),
+                float(row["low"]),
+                float(row["close"]),
+            ))
+
+    if not timestamps:
+        return 0
+
+    ts = np.array(timestamps, dtype=np.int64)
+    ohlc = np.array(bars, dtype=np.float64).T
+
+    existing = get_bars(symbol)
+    if existing is not None:
+        ts = np.concatenate([ts, existing[0]])
+        ohlc = np.concatenate([ohlc, existing[1]], axis=1)
+
+    # New rows come first, so the unique index keeps them over stored bars
+    ts, first = np.unique(ts, return_index=True)
+    ohlc = np.ascontiguousarray(ohlc[:, first])
+
+    directory = _symbol_dir(symbol)
+    directory.mkdir(parents=True, exist_ok=True)
+    _save(directory / "bars.npy", ohlc)
+    _save(directory / "ts.npy", ts)
+
+    return len(timestamps)
+
+
+def get_bars(symbol):
+    """Return memory-mapped (timestamps, bars) for a symbol, or None."""
+    directory = _symbol_dir(symbol)
+    ts_path = directory / "ts.npy"
+    if not ts_path.exists():
+        return None
+
+    version = ts_path.stat().st_mtime_ns
+    cached = _open_stores.get(symbol)
+    if cached is None or cached[0] != version:
+        cached = (
+            version,
+            np.load(ts_path, mmap_mode="r"),
+            np.load(directory / "bars.npy", mmap_mode="r"),
+        )
+        _open_stores[symbol] = cached
+
+    return cached[1], cached[2]
+
+
+# -----------------------------
+# Excursions
+# -----------------------------
+def _window_reduce(ufunc, values, start, end):
+    n = values.shape[0]
+    idx = np.empty(start.size * 2, dtype=np.intp)
+    idx[0::2] = start
+    idx[1::2] = np.minimum(end, n - 1)
+
+    out = ufunc.reduceat(values, idx)[0::2]
+
+    # reduceat cannot take n as an index, so fold the last bar in separately
+    tail = end == n
+    out[tail] = ufunc(out[tail], values[n - 1])
+    return out
+
+
+def _find_exit(bars, start, price):
+    """Index one past the first bar from `start` whose range contains `price`.
+
+    Scans in fixed-size chunks so only the bars near the entry are paged in;
+    returns `start` (an empty window) if no bar within MAX_EXIT_BARS matches.
+    """
+    limit = min(bars.shape[1], start + MAX_EXIT_BARS)
+    for lo in range(start, limit, EXIT_SCAN_CHUNK):
+        hi = min(lo + EXIT_SCAN_CHUNK, limit)
+        hit = np.flatnonzero((bars[LOW, lo:hi] <= price) & (bars[HIGH, lo:hi] >= price))
+        if hit.size:
+            return lo + hit[0] + 1
+    return start
+
+
+def _symbol_excursions(ts, bars, trades, now):
+    entry_ts = np.array([_epoch(t["trade_date"]) for t in trades], dtype=np.int64)
+    entry = np.array([float(t["entry_price"]) for t in trades])
+    is_long = np.array([t["direction"] == "LONG" for t in trades])
+    is_open = np.array([t["outcome"] is None for t in trades])
+
+    # The bar containing the entry is the last one starting at or before it;
+    # trades entered before the first stored bar get -1 and are left out
+    start = np.searchsorted(ts, entry_ts, side="right") - 1
+    end = np.full(len(trades), ts.size, dtype=np.intp)
+
+    # Closed trades end on the first bar whose range touches the exit price
+    for i, t in enumerate(trades):
+        if is_open[i] or start[i] < 0:
+            continue
+        if not t["exit_price"]:
+            end[i] = start[i]
+            continue
+        end[i] = _find_exit(bars, start[i], float(t["exit_price"]))
+
+    valid = np.flatnonzero((start >= 0) & (start < end))
+    if valid.size == 0:
+        return {}
+
+    s, e = start[valid], end[valid]
+    highs = _window_reduce(np.maximum, bars[HIGH], s, e)
+    lows = _window_reduce(np.minimum, bars[LOW], s, e)
+    ref = entry[valid]
+    long_ = is_long[valid]
+
+    up = (highs - ref) / ref
+    down = (ref - lows) / ref
+    mfe = np.maximum(np.where(long_, up, down), 0.0)
+    mae = np.maximum(np.where(long_, down, up), 0.0)
+
+    open_ = is_open[valid]
+    seconds = np.where(open_, now, ts[e - 1]) - entry_ts[valid]
+
+    mark = float(bars[CLOSE, ts.size - 1])
+    move = (mark - ref) / ref
+    unrealized = np.where(long_, move, -move)
+
+    result = {}
+    for k, i in enumerate(valid):
+        metrics = {
+            "mae": float(mae[k]),
+            "mfe": float(mfe[k]),
+            "seconds": int(max(seconds[k], 0)),
+        }
+        if open_[k]:
+            metrics["mark"] = mark
+            metrics["unrealized"] = float(unrealized[k])
+        result[trades[i]["id"]] = metrics
+
+    return result
+
+
+def trade_excursions(trades, now=None):
+    """MAE/MFE (as fractions of entry), time in trade and open-trade marks.
+
+    `trades` are rows with id, symbol, direction, trade_date, entry_price,
+    exit_price and outcome. Trades without price data are left out.
+    """
+    now = _epoch(now or datetime.now(timezone.utc))
+
+    by_symbol = {}
+    for t in trades:
+        if t["entry_price"]:
+            by_symbol.setdefault(t["symbol"], []).append(t)
+
+    result = {}
+    for symbol, group in by_symbol.items():
+        bars = get_bars(symbol)
+        if bars is None or bars[0].size == 0:
+            continue
+        result.update(_symbol_excursions(bars[0], bars[1], group, now))
+
+    return result
+
+
+def get_excursion_stats_by_setup(start_date, end_date, setups):
+    conn = get_connection()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT id, symbol, direction, setup, trade_date,
+               entry_price, exit_price, outcome
+        FROM tracker.trades
+        WHERE trade_date::date BETWEEN %s AND %s
+          AND outcome IS NOT NULL
+          AND setup = ANY(%s::setup_type[])
+        ORDER BY setup, trade_date
+        """,
+        (start_date, end_date, setups)
+    )
+
+    trades = cur.fetchall()
+    cur.close()
+    conn.close()
+
+    excursions = trade_excursions(trades)
+
+    grouped = {}
+    for t in trades:
+        if t["id"] in excursions:
+            grouped.setdefault(t["setup"], []).append(excursions[t["id"]])
+
+    rows = []
+    for setup in sorted(grouped):
+        metrics = grouped[setup]
+        rows.append({
+            "setup": setup,
+            "total": len(metrics),
+            "avg_mae": float(np.mean([m["mae"] for m in metrics])),
+            "avg_mfe": float(np.mean([m["mfe"] for m in metrics])),
+            "avg_seconds": float(np.mean([m["seconds"] for m in metrics])),
+        })
+
+    return rows
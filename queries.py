@@ -0,0 +1,290 @@
+# queries.py
+from psycopg2.extras import RealDictCursor
+
+from analytics import mirrored
+from db import get_connection as get_conn
+
+# Columns served by the public API; leaves out internal change-tracking
+# columns and the server-local screenshot path
+TRADE_PAGE_COLUMNS = """
+    id, trade_date, symbol, direction, setup,
+    entry_price, exit_price, outcome, notes
+"""
+
+
+def get_trades_by_date(day):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute(
+        """
+        SELECT *
+        FROM tracker.trades
+        WHERE trade_date::date = %s
+        ORDER BY trade_date ASC
+        """,
+        (day,)
+    )
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
+
+def insert_trade(trade_date, symbol, direction, setup, entry_price, notes):
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO tracker.trades
+        (trade_date, symbol, direction, setup, entry_price, notes)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        """,
+        (trade_date, symbol, direction, setup, entry_price, notes)
+    )
+    conn.commit()
+    cur.close()
+    conn.close()
+
+def get_day_outcomes_for_month(year, month):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT
+            trade_date::date AS day,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM tracker.trades
+        WHERE EXTRACT(YEAR FROM trade_date) = %s
+          AND EXTRACT(MONTH FROM trade_date) = %s
+        GROUP BY trade_date::date
+        """,
+        (year, month)
+    )
+
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+
+    result = {}
+    for r in rows:
+        if r["wins"] > r["losses"]:
+            result[r["day"]] = "green"
+        elif r["losses"] > r["wins"]:
+            result[r["day"]] = "red"
+        else:
+            result[r["day"]] = "gray"
+
+    return result
+
+def get_day_stats(day):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM tracker.trades
+        WHERE trade_date::date = %s
+        """,
+        (day,)
+    )
+
+    stats = cur.fetchone()
+    cur.close()
+    conn.close()
+
+    return stats
+
+@mirrored
+def get_stats_by_setup(start_date, end_date):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT
+            setup,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM tracker.trades
+        WHERE trade_date::date BETWEEN %s AND %s
+          AND outcome IS NOT NULL
+        GROUP BY setup
+        ORDER BY setup
+        """,
+        (start_date, end_date)
+    )
+
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
+
+@mirrored
+def get_stats_by_direction(start_date, end_date):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT
+            direction,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM tracker.trades
+        WHERE trade_date::date BETWEEN %s AND %s
+          AND outcome IS NOT NULL
+        GROUP BY direction
+        ORDER BY direction
+        """,
+        (start_date, end_date)
+    )
+
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
+
+def close_trade(trade_id, outcome, exit_price):
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        UPDATE tracker.trades
+        SET outcome = %s,
+            exit_price = %s
+        WHERE id = %s
+        """,
+        (outcome, exit_price if exit_price > 0 else None, trade_id)
+    )
+    conn.commit()
+    cur.close()
+    conn.close()
+
+def update_trade(trade_id, entry_price, exit_price, outcome, notes):
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        UPDATE tracker.trades
+        SET entry_price = %s,
+            exit_price = %s,
+            outcome = %s,
+            notes = %s
+        WHERE id = %s
+        """,
+        (
+            entry_price,
+            exit_price if exit_price > 0 else None,
+            outcome,
+            notes,
+            trade_id
+        )
+    )
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def delete_trade(trade_id):
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        "DELETE FROM tracker.trades WHERE id = %s",
+        (trade_id,)
+    )
+    conn.commit()
+    cur.close()
+    conn.close()
+
+@mirrored
+def get_stats_for_setups(start_date, end_date, setups):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM tracker.trades
+        WHERE trade_date::date BETWEEN %s AND %s
+          AND outcome IS NOT NULL
+          AND setup = ANY(%s::setup_type[])
+        """,
+        (start_date, end_date, setups)
+    )
+
+    row = cur.fetchone()
+    cur.close()
+    conn.close()
+    return row
+
+
+@mirrored
+def get_direction_stats_for_setups(start_date, end_date, setups):
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    cur.execute(
+        """
+        SELECT
+            direction,
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins,
+            COUNT(*) FILTER (WHERE outcome = 'LOSS') AS losses
+        FROM tracker.trades
+        WHERE trade_date::date BETWEEN %s AND %s
+          AND outcome IS NOT NULL
+          AND setup = ANY(%s::setup_type[])
+        GROUP BY direction
+        ORDER BY direction
+        """,
+        (start_date, end_date, setups)
+    )
+
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
+
+def get_trades_page(start_date, end_date, after=None, limit=100):
+    """Trades in a date range ordered by (trade_date, id), after a keyset cursor."""
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+
+    if after is None:
+        cur.execute(
+            f"""
+            SELECT {TRADE_PAGE_COLUMNS}
+            FROM tracker.trades
+            WHERE trade_date::date BETWEEN %s AND %s
+            ORDER BY trade_date, id
+            LIMIT %s
+            """,
+            (start_date, end_date, limit)
+        )
+    else:
+        cur.execute(
+            f"""
+            SELECT {TRADE_PAGE_COLUMNS}
+            FROM tracker.trades
+            WHERE trade_date::date BETWEEN %s AND %s
+              AND (trade_date, id) > (%s, %s)
+            ORDER BY trade_date, id
+            LIMIT %s
+            """,
+            (start_date, end_date, after[0], after[1], limit)
+        )
+
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
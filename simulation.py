@@ -0,0 +1,166 @@
+# simulation.py
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Returns for trades without both prices fall back to their outcome, in R
+OUTCOME_R = {"WIN": 1.0, "LOSS": -1.0, "BREAKEVEN": 0.0}
+
+CHUNK_CELLS = 2_000_000       # paths * trades generated per vectorized batch (~100 MB)
+PARALLEL_CELLS = 5_000_000    # paths * trades above which batches go to a process pool
+CACHE_SIZE = 64
+
+_cache = {}
+
+
+# -----------------------------
+# Historical returns
+# -----------------------------
+def trade_r_multiples(rows):
+    """Turn (direction, outcome, entry_price, exit_price) rows into R-multiples.
+
+    1R is the average losing price move of the priced trades in the sample.
+    """
+    moves = []
+    for direction, outcome, entry, exit_ in rows:
+        if entry and exit_:
+            move = (float(exit_) - float(entry)) / float(entry)
+            moves.append(move if direction == "LONG" else -move)
+        else:
+            moves.append(None)
+
+    losses = [-m for m in moves if m is not None and m < 0]
+    one_r = sum(losses) / len(losses) if losses else None
+
+    result = []
+    for row, move in zip(rows, moves):
+        if move is not None and one_r:
+            result.append(move / one_r)
+        else:
+            result.append(OUTCOME_R[row[1]])
+
+    return np.array(result, dtype=np.float64)
+
+
+def get_trade_returns(conn, setup, start_date, end_date):
+    cur = conn.cursor()
+
+    cur.execute("""
+        SELECT direction, outcome, entry_price, exit_price
+        FROM tracker.trades
+        WHERE setup = %s
+          AND trade_date::date BETWEEN %s AND %s
+          AND outcome IS NOT NULL
+        ORDER BY trade_date, id;
+    """, (setup, start_date, end_date))
+
+    rows = cur.fetchall()
+    conn.commit()
+    cur.close()
+
+    return trade_r_multiples(rows)
+
+
+# -----------------------------
+# Path generation
+# -----------------------------
+def _longest_run(mask):
+    counts = np.cumsum(mask, axis=1, dtype=np.int32)
+    resets = np.where(mask, 0, counts)
+    np.maximum.accumulate(resets, axis=1, out=resets)
+    return (counts - resets).max(axis=1)
+
+
+def _simulate_chunk(returns, n_paths, n_trades, risk, ruin_level, seed):
+    rng = np.random.default_rng(seed)
+    r = returns[rng.integers(0, returns.size, size=(n_paths, n_trades))]
+
+    growth = np.maximum(1.0 + risk * r, 0.0)
+    equity = np.cumprod(growth, axis=1)
+
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, 1.0, out=peak)
+    max_drawdown = (1.0 - equity / peak).max(axis=1)
+
+    ruined = equity.min(axis=1) <= ruin_level
+
+    return max_drawdown, ruined, _longest_run(r < 0), _longest_run(r > 0)
+
+
+def run_simulation(returns, n_paths=10_000, n_trades=500, risk=0.01,
+                   ruin_level=0.5, seed=None):
+    """Bootstrap `returns` (in R) into equity paths risking `risk` of equity per trade.
+
+    A path is ruined once equity touches `ruin_level` of the starting balance.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    if returns.size == 0:
+        raise ValueError("No closed trades to simulate")
+    if n_paths < 1 or n_trades < 1:
+        raise ValueError("Need at least one path and one trade")
+
+    # Chunks are sized in cells so a batch's memory does not grow with n_trades
+    chunk_paths = max(1, CHUNK_CELLS // n_trades)
+    sizes = [chunk_paths] * (n_paths // chunk_paths)
+    if n_paths % chunk_paths:
+        sizes.append(n_paths % chunk_paths)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    args = [
+        (returns, size, n_trades, risk, ruin_level, s)
+        for size, s in zip(sizes, seeds)
+    ]
+
+    workers = min(len(sizes), os.cpu_count() or 1)
+    if workers > 1 and n_paths * n_trades >= PARALLEL_CELLS:
+        # Spawn, not fork: the Streamlit server that calls this is multi-threaded
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            chunks = list(pool.map(_simulate_chunk, *zip(*args)))
+    else:
+        chunks = [_simulate_chunk(*a) for a in args]
+
+    max_drawdown, ruined, loss_streak, win_streak = (
+        np.concatenate(parts) for parts in zip(*chunks)
+    )
+    p50, p95, p99 = np.percentile(max_drawdown, [50, 95, 99])
+
+    return {
+        "paths": n_paths,
+        "trades": n_trades,
+        "sample_size": int(returns.size),
+        "risk": risk,
+        "drawdown_p50": float(p50),
+        "drawdown_p95": float(p95),
+        "drawdown_p99": float(p99),
+        "risk_of_ruin": float(ruined.mean()),
+        "avg_loss_streak": float(loss_streak.mean()),
+        "loss_streak_p95": float(np.percentile(loss_streak, 95)),
+        "avg_win_streak": float(win_streak.mean()),
+    }
+
+
+# -----------------------------
+# Cached entry point
+# -----------------------------
+def simulate_setup(conn, setup, start_date, end_date, n_paths=10_000, n_trades=500,
+                   risk=0.01, ruin_level=0.5, seed=None):
+    returns = get_trade_returns(conn, setup, start_date, end_date)
+    if returns.size == 0:
+        return None
+
+    data_version = hashlib.sha1(returns.tobytes()).hexdigest()
+    key = (setup, start_date, end_date, data_version,
+           n_paths, n_trades, risk, ruin_level, seed)
+
+    if key not in _cache:
+        if len(_cache) >= CACHE_SIZE:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = run_simulation(
+            returns, n_paths, n_trades, risk, ruin_level, seed
+        )
+
+    return _cache[key]
@@ -0,0 +1,291 @@
+# stats_snapshot.py
+import json
+import socket
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+
+from psycopg2 import errors
+
+SNAPSHOT_PATH = Path.home() / ".trading_journal" / "stats_snapshot.json"
+SNAPSHOT_FORMAT = 2
+
+# Change tracking, installed once by `tracking_journal.py migrate`.
+#
+# Every row version carries the id of the transaction that wrote it
+# (change_xid), and every UPDATE/DELETE copies the old version's counted
+# fields into the tombstone table together with both transaction ids.
+# Consumers remember the txid_snapshot they last read at; a change is new to
+# them exactly when its transaction is not visible in that snapshot, which
+# also catches transactions that were assigned an id early but committed late.
+#
+# Each consumer records its snapshot's xmin in change_consumers. Tombstones
+# below the smallest recorded xmin have been seen by everyone and are pruned;
+# delete the row of a consumer that is retired so it stops holding them back.
+SCHEMA_SQL = """
+ALTER TABLE tracker.trades ADD COLUMN IF NOT EXISTS updated_at timestamptz;
+ALTER TABLE tracker.trades ADD COLUMN IF NOT EXISTS change_xid bigint;
+CREATE INDEX IF NOT EXISTS trades_change_xid_idx ON tracker.trades (change_xid);
+
+CREATE TABLE IF NOT EXISTS tracker.trade_tombstones (
+    trade_id bigint NOT NULL,
+    setup text,
+    direction text,
+    outcome text,
+    old_xid bigint,
+    xid bigint NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trade_tombstones_xid_idx ON tracker.trade_tombstones (xid);
+
+CREATE TABLE IF NOT EXISTS tracker.change_consumers (
+    name text PRIMARY KEY,
+    xmin bigint NOT NULL,
+    seen_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION tracker.track_trade_changes() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        INSERT INTO tracker.trade_tombstones
+            (trade_id, setup, direction, outcome, old_xid, xid)
+        VALUES
+            (OLD.id, OLD.setup::text, OLD.direction::text, OLD.outcome::text,
+             OLD.change_xid, txid_current());
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    NEW.change_xid = txid_current();
+    NEW.updated_at = clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trades_track_changes ON tracker.trades;
+CREATE TRIGGER trades_track_changes
+BEFORE INSERT OR UPDATE OR DELETE ON tracker.trades
+FOR EACH ROW EXECUTE FUNCTION tracker.track_trade_changes();
+"""
+
+CONSUMER_NAME = f"stats_snapshot:{socket.gethostname()}:{SNAPSHOT_PATH}"
+
+
+# -----------------------------
+# Schema
+# -----------------------------
+def install_schema(conn):
+    cur = conn.cursor()
+    cur.execute(SCHEMA_SQL)
+    conn.commit()
+    cur.close()
+
+
+def has_change_tracking(cur):
+    cur.execute("""
+        SELECT
+            to_regclass('tracker.trade_tombstones') IS NOT NULL
+            AND to_regclass('tracker.change_consumers') IS NOT NULL
+            AND EXISTS (
+                SELECT 1
+                FROM information_schema.columns
+                WHERE table_schema = 'tracker'
+                  AND table_name = 'trades'
+                  AND column_name = 'change_xid'
+            );
+    """)
+    return cur.fetchone()[0]
+
+
+def begin_repeatable_read(cur):
+    # Scoped to this transaction, so a shared connection keeps its default level
+    cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ;")
+
+
+def register_consumer(conn, name, txid_snapshot):
+    """Record how far `name` has read and prune tombstones every consumer has seen."""
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            INSERT INTO tracker.change_consumers (name, xmin, seen_at)
+            VALUES (%s, txid_snapshot_xmin(%s::txid_snapshot), now())
+            ON CONFLICT (name) DO UPDATE
+                SET xmin = EXCLUDED.xmin,
+                    seen_at = EXCLUDED.seen_at;
+        """, (name, txid_snapshot))
+        cur.execute("""
+            DELETE FROM tracker.trade_tombstones
+            WHERE xid < (SELECT MIN(xmin) FROM tracker.change_consumers);
+        """)
+        conn.commit()
+    except errors.InsufficientPrivilege:
+        # Read-only roles can still fold; pruning is left to another consumer
+        conn.rollback()
+    finally:
+        cur.close()
+
+
+# -----------------------------
+# Snapshot
+# -----------------------------
+def empty_snapshot(db_name):
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "db": db_name,
+        "txid_snapshot": None,
+        "setup": {},
+        "direction": {},
+    }
+
+
+def load_snapshot(db_name):
+    try:
+        snapshot = json.loads(SNAPSHOT_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("format") != SNAPSHOT_FORMAT or snapshot.get("db") != db_name:
+        return None
+    return snapshot
+
+
+def save_snapshot(snapshot):
+    SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = SNAPSHOT_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(snapshot))
+    tmp.replace(SNAPSHOT_PATH)
+
+
+def apply_row(snapshot, setup, direction, outcome, sign):
+    if outcome is None:
+        return
+    win = 1 if outcome == "WIN" else 0
+    for kind, key in (("setup", setup), ("direction", direction)):
+        counts = snapshot[kind].setdefault(key, [0, 0])
+        counts[0] += sign
+        counts[1] += sign * win
+        if counts[0] == 0:
+            del snapshot[kind][key]
+
+
+# -----------------------------
+# Recompute / fold
+# -----------------------------
+def full_recompute(conn, db_name):
+    """Aggregate the whole table.
+
+    Without change tracking installed the result has no txid_snapshot and
+    cannot be folded into later.
+    """
+    snapshot = empty_snapshot(db_name)
+    cur = conn.cursor()
+
+    begin_repeatable_read(cur)
+    if has_change_tracking(cur):
+        # Same transaction snapshot as the aggregate below
+        cur.execute("SELECT txid_current_snapshot()::text;")
+        snapshot["txid_snapshot"] = cur.fetchone()[0]
+
+    cur.execute("""
+        SELECT
+            setup::text,
+            direction::text,
+            COUNT(*) AS trades,
+            COUNT(*) FILTER (WHERE outcome = 'WIN') AS wins
+        FROM tracker.trades
+        WHERE outcome IS NOT NULL
+        GROUP BY setup, direction;
+    """)
+    for setup, direction, trades, wins in cur.fetchall():
+        for kind, key in (("setup", setup), ("direction", direction)):
+            counts = snapshot[kind].setdefault(key, [0, 0])
+            counts[0] += trades
+            counts[1] += wins
+
+    conn.commit()
+    cur.close()
+    return snapshot
+
+
+def fold_changes(conn, snapshot):
+    previous = snapshot["txid_snapshot"]
+    cur = conn.cursor()
+
+    begin_repeatable_read(cur)
+    cur.execute("SELECT txid_current_snapshot()::text;")
+    current = cur.fetchone()[0]
+
+    # Old versions that were counted under the previous snapshot and have
+    # since been replaced or deleted
+    cur.execute("""
+        SELECT setup, direction, outcome
+        FROM tracker.trade_tombstones
+        WHERE xid >= txid_snapshot_xmin(%(prev)s::txid_snapshot)
+          AND NOT txid_visible_in_snapshot(xid, %(prev)s::txid_snapshot)
+          AND (old_xid IS NULL
+               OR txid_visible_in_snapshot(old_xid, %(prev)s::txid_snapshot));
+    """, {"prev": previous})
+    removed = cur.fetchall()
+
+    # Current versions written by transactions the previous snapshot did not see
+    cur.execute("""
+        SELECT setup::text, direction::text, outcome::text
+        FROM tracker.trades
+        WHERE change_xid >= txid_snapshot_xmin(%(prev)s::txid_snapshot)
+          AND NOT txid_visible_in_snapshot(change_xid, %(prev)s::txid_snapshot);
+    """, {"prev": previous})
+    changed = cur.fetchall()
+
+    conn.commit()
+    cur.close()
+
+    for setup, direction, outcome in removed:
+        apply_row(snapshot, setup, direction, outcome, -1)
+    for setup, direction, outcome in changed:
+        apply_row(snapshot, setup, direction, outcome, +1)
+
+    snapshot["txid_snapshot"] = current
+    return snapshot
+
+
+def get_stats(conn, db_name, full=False, verify=False):
+    """Return (snapshot, tracked, verified) for the win-rate stats.
+
+    `tracked` says whether change tracking is installed. Never changes the
+    schema: without change tracking every call is a full recompute and
+    nothing is saved.
+    """
+    snapshot = None if full else load_snapshot(db_name)
+
+    if snapshot is None or snapshot["txid_snapshot"] is None:
+        snapshot = full_recompute(conn, db_name)
+    else:
+        try:
+            snapshot = fold_changes(conn, snapshot)
+        except (errors.UndefinedTable, errors.UndefinedColumn):
+            conn.rollback()
+            snapshot = full_recompute(conn, db_name)
+
+    verified = None
+    if verify:
+        fresh = full_recompute(conn, db_name)
+        verified = (
+            fresh["setup"] == snapshot["setup"]
+            and fresh["direction"] == snapshot["direction"]
+        )
+        snapshot = fresh
+
+    tracked = snapshot["txid_snapshot"] is not None
+    if tracked:
+        save_snapshot(snapshot)
+        register_consumer(conn, CONSUMER_NAME, snapshot["txid_snapshot"])
+
+    return snapshot, tracked, verified
+
+
+def stat_rows(snapshot, kind):
+    rows = []
+    for key in sorted(snapshot[kind]):
+        trades, wins = snapshot[kind][key]
+        win_rate = (Decimal(wins) / Decimal(trades)).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+        rows.append((key, trades, wins, win_rate))
+    return rows
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+
+import pytest
+
+from api import decode_cursor, encode_cursor, etag_matches, months_between
+
+ETAG = '"0123456789abcdef0123"'
+
+
+def test_etag_matches_exact_and_weak():
+    assert etag_matches(ETAG, ETAG)
+    assert etag_matches(ETAG, "W/" + ETAG)
+
+
+def test_etag_matches_any_entry_of_a_list():
+    assert etag_matches(ETAG, f'"other", {ETAG}')
+    assert etag_matches(ETAG, "*")
+
+
+def test_etag_does_not_match_substrings_or_missing_header():
+    assert not etag_matches(ETAG, None)
+    assert not etag_matches(ETAG, "")
+    assert not etag_matches(ETAG, '"x' + ETAG[1:])
+    assert not etag_matches('"0123"', ETAG)
+
+
+def test_months_between_spans_year_end():
+    assert months_between(date(2023, 11, 15), date(2024, 2, 1)) == [
+        date(2023, 11, 1), date(2023, 12, 1), date(2024, 1, 1), date(2024, 2, 1),
+    ]
+    assert months_between(date(2024, 3, 5), date(2024, 3, 20)) == [date(2024, 3, 1)]
+
+
+def test_cursor_round_trip():
+    row = {"trade_date": datetime(2024, 5, 6, 14, 30, 15, 123456), "id": 42}
+    assert decode_cursor(encode_cursor(row)) == (row["trade_date"], 42)
+
+
+def test_invalid_cursor_is_a_value_error():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("not a cursor")
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Total cumulative import time of `tracking_journal.py --help`, in microseconds
+COLD_START_BUDGET_US = 150_000
+
+HEAVY_MODULES = ("psycopg2", "numpy", "duckdb", "pandas", "streamlit")
+
+
+def import_times(*args):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "tracking_journal.py", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        times.append((name.rstrip(), int(cumulative)))
+    return times
+
+
+def test_help_does_not_import_heavy_dependencies():
+    imported = {name.strip().split(".")[0] for name, _ in import_times("--help")}
+    assert not imported & set(HEAVY_MODULES)
+
+
+def test_help_cold_start_within_budget():
+    # Top-level entries (no indentation) already include their children
+    total = sum(us for name, us in import_times("--help") if not name.startswith("  "))
+    assert total < COLD_START_BUDGET_US, f"cold start imports took {total / 1000:.1f} ms"
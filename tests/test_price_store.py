@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+import price_store
+from price_store import _find_exit, _symbol_excursions, _window_reduce
+
+DAY = 86_400
+JAN_1 = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def daily_bars(rows):
+    """Bars starting at midnight UTC on consecutive days from 2024-01-01."""
+    ts = JAN_1 + DAY * np.arange(len(rows), dtype=np.int64)
+    bars = np.array(rows, dtype=np.float64).T
+    return ts, bars
+
+
+def trade(trade_date, entry, exit_price=None, outcome=None, direction="LONG", id=1):
+    return {
+        "id": id,
+        "direction": direction,
+        "trade_date": trade_date,
+        "entry_price": entry,
+        "exit_price": exit_price,
+        "outcome": outcome,
+    }
+
+
+def test_window_reduce_matches_python_slices():
+    values = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0])
+    start = np.array([0, 2, 5, 7, 3])
+    end = np.array([3, 5, 8, 8, 4])
+
+    highs = _window_reduce(np.maximum, values, start, end)
+    lows = _window_reduce(np.minimum, values, start, end)
+
+    assert highs.tolist() == [max(values[s:e]) for s, e in zip(start, end)]
+    assert lows.tolist() == [min(values[s:e]) for s, e in zip(start, end)]
+
+
+def test_find_exit_across_chunks(monkeypatch):
+    monkeypatch.setattr(price_store, "EXIT_SCAN_CHUNK", 3)
+    lows = np.arange(10, dtype=np.float64)
+    bars = np.vstack([lows, lows + 0.5, lows, lows])
+
+    # Bar 7 (range 7.0-7.5) is the first to contain 7.2, in the third chunk
+    assert _find_exit(bars, 1, 7.2) == 8
+    assert _find_exit(bars, 1, 0.2) == 1          # only bar 0 matches, before start
+    assert _find_exit(bars, 1, 100.0) == 1
+
+
+def test_find_exit_gives_up_after_max_bars(monkeypatch):
+    monkeypatch.setattr(price_store, "EXIT_SCAN_CHUNK", 2)
+    monkeypatch.setattr(price_store, "MAX_EXIT_BARS", 4)
+    lows = np.arange(10, dtype=np.float64)
+    bars = np.vstack([lows, lows + 0.5, lows, lows])
+
+    assert _find_exit(bars, 0, 3.2) == 4
+    assert _find_exit(bars, 0, 4.2) == 0
+
+
+def test_entry_uses_the_bar_that_contains_it():
+    ts, bars = daily_bars([
+        # open, high, low, close
+        (100, 105, 90, 102),
+        (102, 110, 101, 108),
+    ])
+    entered = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+    result = _symbol_excursions(ts, bars, [trade(entered, 100.0)], now=JAN_1 + 2 * DAY)
+
+    assert result[1]["mae"] == pytest.approx(0.10)
+    assert result[1]["mfe"] == pytest.approx(0.10)
+
+
+def test_trade_entered_during_last_bar_is_marked():
+    ts, bars = daily_bars([
+        (100, 105, 95, 100),
+        (100, 104, 98, 103),
+    ])
+    entered = datetime(2024, 1, 2, 15, tzinfo=timezone.utc)
+    result = _symbol_excursions(ts, bars, [trade(entered, 100.0)], now=JAN_1 + 2 * DAY)
+
+    assert result[1]["mark"] == 103
+    assert result[1]["unrealized"] == pytest.approx(0.03)
+    assert result[1]["mae"] == pytest.approx(0.02)
+
+
+def test_trade_entered_before_first_bar_is_left_out():
+    ts, bars = daily_bars([(100, 105, 95, 100)])
+    entered = datetime(2023, 12, 31, 12, tzinfo=timezone.utc)
+    assert _symbol_excursions(ts, bars, [trade(entered, 100.0)], now=JAN_1 + DAY) == {}
+
+
+def test_closed_trade_window_ends_at_exit_bar():
+    ts, bars = daily_bars([
+        (100, 102, 99, 101),
+        (101, 112, 100, 111),   # exit at 110 is hit here
+        (111, 130, 80, 90),     # after the exit, must not count
+    ])
+    short = trade(datetime(2024, 1, 1, 9, tzinfo=timezone.utc), 100.0,
+                  exit_price=110.0, outcome="LOSS", direction="SHORT")
+    result = _symbol_excursions(ts, bars, [short], now=JAN_1 + 3 * DAY)
+
+    assert result[1]["mae"] == pytest.approx(0.12)
+    assert result[1]["mfe"] == pytest.approx(0.01)
+    assert "mark" not in result[1]
+    assert result[1]["seconds"] == DAY - 9 * 3600
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import simulation
+from simulation import _longest_run, run_simulation, trade_r_multiples
+
+
+def test_longest_run():
+    mask = np.array([
+        [True, True, False, True, True, True],
+        [False, False, False, False, False, False],
+        [True, True, True, True, True, True],
+    ])
+    assert _longest_run(mask).tolist() == [3, 0, 6]
+
+
+def test_r_multiples_use_average_loss_as_one_r():
+    rows = [
+        ("LONG", "WIN", 100, 110),     # +10%
+        ("SHORT", "LOSS", 100, 105),   # -5%
+        ("LONG", "LOSS", 100, 85),     # -15%
+        ("LONG", "WIN", None, None),
+    ]
+    assert trade_r_multiples(rows) == pytest.approx([1.0, -0.5, -1.5, 1.0])
+
+
+def test_r_multiples_fall_back_to_outcome_without_priced_losses():
+    rows = [("LONG", "WIN", 100, 110), ("SHORT", "BREAKEVEN", None, None)]
+    assert trade_r_multiples(rows).tolist() == [1.0, 0.0]
+
+
+def test_all_losses_are_ruined_with_a_full_loss_streak():
+    sim = run_simulation([-1.0, -1.0], n_paths=200, n_trades=50,
+                         risk=0.02, ruin_level=0.5, seed=1)
+    assert sim["risk_of_ruin"] == 1.0
+    assert sim["avg_loss_streak"] == 50
+    assert sim["loss_streak_p95"] == 50
+    assert sim["avg_win_streak"] == 0
+    assert sim["drawdown_p50"] == pytest.approx(1 - 0.98 ** 50)
+
+
+def test_all_wins_have_no_drawdown():
+    sim = run_simulation([1.0, 2.0], n_paths=100, n_trades=20, seed=1)
+    assert sim["risk_of_ruin"] == 0.0
+    assert sim["drawdown_p99"] == 0.0
+    assert sim["avg_win_streak"] == 20
+
+
+def test_seeded_runs_are_deterministic_across_chunks(monkeypatch):
+    # Force several chunks, including a partial last one
+    monkeypatch.setattr(simulation, "CHUNK_CELLS", 7 * 30)
+    returns = [1.5, -1.0, -1.0, 0.5, 2.0]
+
+    first = run_simulation(returns, n_paths=100, n_trades=30, seed=42)
+    second = run_simulation(returns, n_paths=100, n_trades=30, seed=42)
+
+    assert first == second
+    assert first["paths"] == 100
+
+
+def test_empty_sample_is_rejected():
+    with pytest.raises(ValueError):
+        run_simulation([], n_paths=10, n_trades=10)
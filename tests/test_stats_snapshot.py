@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import pytest
+
+import stats_snapshot
+from stats_snapshot import (
+    SNAPSHOT_FORMAT,
+    apply_row,
+    empty_snapshot,
+    load_snapshot,
+    save_snapshot,
+    stat_rows,
+)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    path = tmp_path / "stats_snapshot.json"
+    monkeypatch.setattr(stats_snapshot, "SNAPSHOT_PATH", path)
+    return path
+
+
+def test_apply_row_counts_trades_and_wins():
+    snapshot = empty_snapshot("db")
+    apply_row(snapshot, "A", "LONG", "WIN", +1)
+    apply_row(snapshot, "A", "SHORT", "LOSS", +1)
+    apply_row(snapshot, "B", "LONG", "BREAKEVEN", +1)
+
+    assert snapshot["setup"] == {"A": [2, 1], "B": [1, 0]}
+    assert snapshot["direction"] == {"LONG": [2, 1], "SHORT": [1, 0]}
+
+
+def test_apply_row_removes_keys_that_drop_to_zero():
+    snapshot = empty_snapshot("db")
+    apply_row(snapshot, "A", "LONG", "WIN", +1)
+    apply_row(snapshot, "A", "LONG", "WIN", -1)
+
+    assert snapshot["setup"] == {}
+    assert snapshot["direction"] == {}
+
+
+def test_apply_row_ignores_open_trades():
+    snapshot = empty_snapshot("db")
+    apply_row(snapshot, "A", "LONG", None, +1)
+    assert snapshot["setup"] == {}
+
+
+def test_stat_rows_are_sorted_with_rounded_win_rate():
+    snapshot = empty_snapshot("db")
+    snapshot["setup"] = {"B": [3, 1], "A": [8, 5]}
+
+    assert stat_rows(snapshot, "setup") == [
+        ("A", 8, 5, Decimal("0.63")),
+        ("B", 3, 1, Decimal("0.33")),
+    ]
+
+
+def test_save_and_load_round_trip(snapshot_path):
+    snapshot = empty_snapshot("trading_tracker")
+    snapshot["txid_snapshot"] = "100:105:101,103"
+    snapshot["setup"] = {"A": [2, 1]}
+    save_snapshot(snapshot)
+
+    assert load_snapshot("trading_tracker") == snapshot
+
+
+def test_load_rejects_other_database_or_format(snapshot_path):
+    save_snapshot(empty_snapshot("trading_tracker"))
+    assert load_snapshot("other_db") is None
+
+    stale = empty_snapshot("trading_tracker")
+    stale["format"] = SNAPSHOT_FORMAT - 1
+    save_snapshot(stale)
+    assert load_snapshot("trading_tracker") is None
+
+
+def test_load_missing_or_corrupt_snapshot(snapshot_path):
+    assert load_snapshot("trading_tracker") is None
+    snapshot_path.write_text("{not json")
+    assert load_snapshot("trading_tracker") is None